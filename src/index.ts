@@ -21,7 +21,6 @@ import {
     logToSonarLintOutput,
     showLogOutput,
 } from "./util/logging"
-import { setExtensionContext } from "./util/util"
 import { languageServerCommand } from "./lsp/server"
 import { JAVA_HOME_CONFIG, installManagedJre, resolveRequirements } from "./util/requirements"
 import { SonarLintExtendedLanguageClient } from "./lsp/client"
@@ -97,7 +96,7 @@ async function runJavaServer(
 }
 
 export async function activate(context: ExtensionContext): Promise<void> {
-    setExtensionContext(context)
+    util.setExtensionContext(context)
     initLogOutput(context)
 
     const serverOptions = () => runJavaServer(context)
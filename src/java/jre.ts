@@ -47,8 +47,7 @@ function getPackageName(): string | undefined {
 
 export function checkJavac(javaHome: string): boolean {
     let file = path.join(javaHome, 'bin', JAVAC_FILENAME)
-    if (fse.existsSync(file)) return true
-    return false
+    return fse.existsSync(file)
 }
 
 export async function checkAndDownloadJRE(context: ExtensionContext): Promise<string | undefined> {
@@ -57,9 +56,7 @@ export async function checkAndDownloadJRE(context: ExtensionContext): Promise<st
     let javaHome = path.join(context.storagePath, `jdk-${JRE_VERSION}`, packageName, 'jre')
     if (checkJavac(javaHome)) return javaHome
     let folder = path.resolve(javaHome, '..')
-    if (fse.existsSync(folder)) {
-        await fse.remove(folder)
-    }
+    await fse.remove(folder)
     // download and extract to data folder
     let registry = registryUrl()
     const tmpfolder = path.join(os.tmpdir(), `jdk-${JRE_VERSION}`)
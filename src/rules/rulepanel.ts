@@ -15,13 +15,13 @@ export function showRuleDescription(factory: coc.FloatFactory) {
     return (params: ShowRuleDescriptionParams) => {
         if (!generatedRulesDescriptions.has(params.key)) {
             const text = computeRuleDescPanelContent(params)
-            generatedRulesDescriptions.set(params.key, text)
+            generatedRulesDescriptions.set(params.key, md.NodeHtmlMarkdown.translate(text))
         }
         const content: string = generatedRulesDescriptions.get(params.key) ?? ""
         factory.show([
             {
                 filetype: "markdown",
-                content: md.NodeHtmlMarkdown.translate(content),
+                content: content,
             },
         ])
     }
@@ -70,7 +70,7 @@ export class PlatformInformation {
 
     private static async GetWindowsArchitecture(): Promise<string> {
         return util
-            .execChildProcess("wmic os get osarchitecture", __dirname)
+            .execChildProcess("wmic", ["os", "get", "osarchitecture"], __dirname)
             .then((architecture) => {
                 if (architecture) {
                     const archArray: string[] = architecture.split(os.EOL)
@@ -94,7 +94,7 @@ export class PlatformInformation {
 
     private static async GetUnixArchitecture(): Promise<string | undefined> {
         return util
-            .execChildProcess("uname -m", __dirname)
+            .execChildProcess("uname", ["-m"], __dirname)
             .then((architecture) => {
                 if (architecture) {
                     return architecture.trim()
@@ -104,12 +104,14 @@ export class PlatformInformation {
     }
 }
 
+let resolvedPlatform: string | undefined
+
 export function getPlatform(): string {
-    const platform = process.platform
-    if (platform === "linux" && isAlpineLinux()) {
-        return "alpine"
+    if (resolvedPlatform === undefined) {
+        const platform = process.platform
+        resolvedPlatform = platform === "linux" && isAlpineLinux() ? "alpine" : platform
     }
-    return platform
+    return resolvedPlatform
 }
 
 // inspired from https://github.com/microsoft/vscode/blob/4e69b30b4c6618e99ffc831bb9441c3e65c6596e/
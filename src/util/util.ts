@@ -32,10 +32,11 @@ export function setExtensionContext(context: coc.ExtensionContext): void {
     extensionPath = extensionContext.extensionPath
 }
 
-export function execChildProcess(process: string, workingDirectory: string, channel?: coc.OutputChannel) {
+export function execChildProcess(file: string, args: string[], workingDirectory: string, channel?: coc.OutputChannel) {
     return new Promise<string>((resolve, reject) => {
-        child_process.exec(
-            process,
+        child_process.execFile(
+            file,
+            args,
             { cwd: workingDirectory, maxBuffer: 500 * 1024 },
             (error: Error | null, stdout: string, stderr: string) => {
                 if (channel) {
@@ -126,9 +127,16 @@ function isDirMatcher(asteriskCount: number, prev: string, next: string): boolea
     return asteriskCount > 1 && (prev === '/' || prev === undefined) && (next === '/' || next === undefined)
 }
 
+let masterRegexCache: { key: string; regex: RegExp } | undefined
+
 export function getMasterRegex(globPatterns: string[]) {
-    const regexes = globPatterns.map(p => globPatternToRegex(p).source)
-    return new RegExp(regexes.join('|'), 'i')
+    // The patterns come from settings and rarely change, reuse the last compiled regex
+    const key = globPatterns.join('\n')
+    if (masterRegexCache?.key !== key) {
+        const regexes = globPatterns.map(p => globPatternToRegex(p).source)
+        masterRegexCache = { key, regex: new RegExp(regexes.join('|'), 'i') }
+    }
+    return masterRegexCache.regex
 }
 
 export function shouldIgnoreBySourceControl(_: string): boolean {
@@ -141,22 +149,22 @@ export function shouldAnalyseFile(fileUriStr: string): ShouldAnalyseFileCheckRes
         return { shouldBeAnalysed: false, reason: 'Skipping analysis for the file preview: ' }
     }
     const fileUri = coc.Uri.parse(fileUriStr)
-    const workspaceFolderConfig = coc.workspace.getConfiguration()
-    const excludes: string | undefined = workspaceFolderConfig.get(ANALYSIS_EXCLUDES)
-    const excludesArray = excludes?.split(',').map(it => it.trim())
-    const filteredFile = getFilesNotMatchedGlobPatterns([fileUri], excludesArray ?? [])
+    const filteredFile = getFilesNotMatchedGlobPatterns([fileUri], getAnalysisExcludes())
     return { shouldBeAnalysed: filteredFile.length === 1, reason: 'Skipping analysis for the excluded file: ' }
 }
 
 export function filterOutFilesIgnoredForAnalysis(fileUris: string[]): FileUris {
-    const workspaceFolderConfig = coc.workspace.getConfiguration()
-    const excludes: string | undefined = workspaceFolderConfig.get(ANALYSIS_EXCLUDES)
-    const excludesArray = excludes?.split(',').map(it => it.trim())
-    const filteredFiles = getFilesNotMatchedGlobPatterns(fileUris.map(it => coc.Uri.parse(it)), excludesArray ?? [])
+    const filteredFiles = getFilesNotMatchedGlobPatterns(fileUris.map(it => coc.Uri.parse(it)), getAnalysisExcludes())
         .map(it => it.toString())
     return { fileUris: filteredFiles }
 }
 
+function getAnalysisExcludes(): string[] {
+    const workspaceFolderConfig = coc.workspace.getConfiguration()
+    const excludes: string | undefined = workspaceFolderConfig.get(ANALYSIS_EXCLUDES)
+    return excludes?.split(',').map(it => it.trim()) ?? []
+}
+
 function isOpenInEditor(fileUri: string) {
     const url = coc.Uri.parse(fileUri)
     const codeFileUri = url.toString()